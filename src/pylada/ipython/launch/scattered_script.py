@@ -24,20 +24,17 @@
 ###############################
 
 """ Runs one job from the jobfolder. """
+import re
+
+_DESC_WS_RE = re.compile(r"\s+")
+""" Collapses whitespace in the docstring used as command-line description. """
 
 
 def main():
-    import re
-    from sys import path as python_path
-    from os.path import exists
     from argparse import ArgumentParser
-    from pylada import jobfolder
-    from pylada.process.mpi import create_global_comm
-    import pylada
 
-    # below would go additional imports.
-
-    parser = ArgumentParser(prog="runone", description=re.sub("\\s+", " ", __doc__[1:]))
+    parser = ArgumentParser(prog="runone",
+                            description=_DESC_WS_RE.sub(" ", __doc__[1:] if __doc__ else ""))
     # colton_mod_start: Change logging level to debug
     parser.add_argument('--logging', dest="logging", default="critical", type=str,
     # parser.add_argument('--logging', dest="logging", default="debug", type=str,
@@ -47,13 +44,15 @@ def main():
                         default=None, type=str,
                         help="testValidProgram")
     parser.add_argument("--jobid", dest="names", nargs='+', type=str,
-                        help="Job name", metavar="N")
+                        help="Job name. Several names can be given, in which case the "
+                             "jobs are run one after the other within this same process.",
+                        metavar="N")
     parser.add_argument("--ppath", dest="ppath", default=None,
                         help="Directory to add to python path",
                         metavar="Directory")
-    parser.add_argument('--nbprocs', dest="nbprocs", default=pylada.default_comm['n'], type=int,
+    parser.add_argument('--nbprocs', dest="nbprocs", default=None, type=int,
                         help="Number of processors with which to launch job.")
-    parser.add_argument('--ppn', dest="ppn", default=pylada.default_comm['ppn'], type=int,
+    parser.add_argument('--ppn', dest="ppn", default=None, type=int,
                         help="Number of processors with which to launch job.")
     # colton_mod_start: Reduce timeout to 30s, probably bad idea if locking with lockfile still enabled
     #  parser.add_argument('--timeout', dest="timeout", default=300, type=int,
@@ -69,14 +68,31 @@ def main():
     except SystemExit:
         return
 
-    from pylada import logger
-    logger.setLevel(level=options.logging.upper())
+    # pylada is only imported once arguments are known to be valid, so that
+    # --help and bad arguments do not pay for the import.
+    import logging
+    from os import makedirs
+    from os.path import exists
+    from sys import path as python_path
+    from pylada import jobfolder, logger
+    from pylada.process.mpi import create_global_comm
+    from pylada.misc import setTestValidProgram, RelativePath
+    import pylada
+
+    # below would go additional imports.
+
+    if options.nbprocs is None:
+        options.nbprocs = pylada.default_comm['n']
+    if options.ppn is None:
+        options.ppn = pylada.default_comm['ppn']
+
+    level = options.logging.upper()
+    logger.setLevel(level=level)
     # colton_mod_start: Print logger level setting
-    print(f'Logger level set to {options.logging.upper()}')
+    logger.debug('Logger level set to %s', level)
     # colton_mod_end
-    from pylada.misc import setTestValidProgram
     tstPgm = options.testValidProgram
-    if tstPgm.lower() == 'none':
+    if tstPgm is not None and tstPgm.lower() == 'none':
         tstPgm = None
     setTestValidProgram(tstPgm)
     from pylada.misc import testValidProgram
@@ -85,41 +101,54 @@ def main():
     if options.ppath is not None:
         python_path.append(options.ppath)
 
-    if not exists(options.pickle):
+    timeout = None if options.timeout <= 0 else options.timeout
+
+    # load raises if the file does not exist, no need to stat it beforehand.
+    # Other I/O errors (permissions, lock timeout...) must still fail the job.
+    try:
+        jobfolder = jobfolder.load(options.pickle, timeout=timeout)
+    except IOError:
+        if exists(RelativePath(options.pickle).path):
+            raise
         print("Could not find file {0}.".format(options.pickle))
         return
 
     # Set up mpi processes.
-    pylada.default_comm['ppn'] = options.ppn
-    pylada.default_comm['n'] = options.nbprocs
+    pylada.default_comm.update(ppn=options.ppn, n=options.nbprocs)
     if testValidProgram is None:
-        create_global_comm(options.nbprocs)   # Sets pylada.default_comm
+        # A single process needs no machine discovery: the plain dictionary is
+        # turned into a communicator when the job starts.
+        if options.nbprocs > 1:
+            create_global_comm(options.nbprocs)   # Sets pylada.default_comm
     else:
         pylada.default_comm = None            # use testValidProgram
 
-    timeout = None if options.timeout <= 0 else options.timeout
-
-    jobfolder = jobfolder.load(options.pickle, timeout=timeout)
-    print(('  ipy/lau/scattered_script: jobfolder: %s' % jobfolder))
-    print(('  ipy/lau/scattered_script: options: %s' % options))
+    logger.debug('ipy/lau/scattered_script: jobfolder: %s', jobfolder)
+    logger.debug('ipy/lau/scattered_script: options: %s', options)
+    # Communicator and testValidProgram are set up once, whatever the number of
+    # jobs, so that batching names amortizes the start-up cost.
+    comm = None if testValidProgram is not None else pylada.default_comm
+    if len(options.names) > 1:
+        logger.info('ipy/lau/scattered_script: batched %d jobs in one interpreter',
+                    len(options.names))
     for name in options.names:
-        logger.info('ipy/lau/scattered_script: testValidProgram: %s' % testValidProgram)
-        logger.info('ipy/lau/scattered_script: name: %s' % name)
-        logger.info('ipy/lau/scattered_script: jobfolder[name]: %s' % jobfolder[name])
-        logger.info('ipy/lau/scattered_script: type(jobfolder[name]): %s' %
-                         type(jobfolder[name]))
-        logger.info(
-            'ipy/lau/scattered_script: jobfolder[name].compute: %s' % jobfolder[name].compute)
-        logger.info(
-            'ipy/lau/scattered_script: type(jobfolder[name].compute): %s' \
-            % type(jobfolder[name].compute))
-        logger.info('ipy/lau/scattered_script: before compute for name: %s' % name)
-
-        comm = pylada.default_comm
-        if testValidProgram is not None:
-            comm = None
-        jobfolder[name].compute(comm=comm, outdir=name)
-        logger.info('ipy/lau/scattered_script: after compute for name: %s' % name)
+        job = jobfolder[name]
+        compute = job.compute
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('ipy/lau/scattered_script: testValidProgram: %s\n'
+                        '  name: %s\n'
+                        '  jobfolder[name]: %s\n'
+                        '  type(jobfolder[name]): %s\n'
+                        '  jobfolder[name].compute: %s\n'
+                        '  type(jobfolder[name].compute): %s\n'
+                        '  before compute for name: %s',
+                        testValidProgram, name, job, type(job), compute, type(compute), name)
+
+        # create the output directory once, before the functional sets itself up.
+        if name and job.is_executable:
+            makedirs(name, exist_ok=True)
+        compute(comm=comm, outdir=name)
+        logger.info('ipy/lau/scattered_script: after compute for name: %s', name)
 
 if __name__ == "__main__":
     main()
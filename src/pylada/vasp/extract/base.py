@@ -123,12 +123,32 @@ class ExtractBase(object):
 
             At this point, checks for the existence of OUTCAR.
             Then checks that timing stuff is present at end of OUTCAR.
+
+            Only success is cached, keyed on the modification time of the
+            OUTCAR: a running calculation must be checked anew until it
+            completes, and a rewritten OUTCAR is checked again.
         """
+        from os import stat
+        from os.path import join
         regex = r"""General\s+timing\s+and\s+accounting\s+informations\s+for\s+this\s+job"""
         try:
-            return self._find_last_OUTCAR(regex) is not None
+            mtime = stat(join(self.directory, self.OUTCAR)).st_mtime_ns
+        except AttributeError:
+            mtime = None
+        except OSError:
+            return False
+        if not hasattr(self, '_properties_cache'):
+            setattr(self, '_properties_cache', {})
+        cache = getattr(self, '_properties_cache')
+        if mtime is not None and cache.get('success') == mtime:
+            return True
+        try:
+            result = self._find_last_OUTCAR(regex) is not None
         except: # noqa: E722
             return False
+        if result and mtime is not None:
+            cache['success'] = mtime
+        return result
 
     @property
     def iterTimes(self):
@@ -1366,6 +1386,43 @@ class ExtractBase(object):
             raise GrepError("Could not find energy in OUTCAR")
         return array(result) * eV
 
+    def tail_total_energies(self, n=2):
+        """ Greps total energies for the last *n* ionic steps from OUTCAR.
+
+            Same as ``total_energies[-n:]``, but reads OUTCAR backwards by
+            chunks, stopping as soon as enough ionic steps are found. Checking
+            convergence of a long run then only touches the end of the file.
+        """
+        if not self.is_dft:
+            raise AttributeError('not a DFT calculation.')
+        from os import SEEK_END
+        from os.path import exists, join
+        from re import compile
+        from numpy import array
+        from quantities import eV
+        from ...error import IOError
+        regex = compile(rb"""energy\s+without\s+entropy=\s*(\S+)\s+energy\(sigma->0\)\s+=\s+\S+""")
+        path = join(self.directory, self.OUTCAR)
+        if not exists(path):
+            raise IOError("Path {0} does not exist.\n".format(path))
+        found, carry = [], b''
+        with open(path, 'rb') as file:
+            position = file.seek(0, SEEK_END)
+            while position > 0 and len(found) < n:
+                start = max(0, position - 65536)
+                file.seek(start)
+                # carry is the start of a line cut short by the previous chunk.
+                chunk = file.read(position - start) + carry
+                position = start
+                if position > 0:
+                    # likewise, the first line of this chunk may be incomplete.
+                    newline = chunk.find(b'\n') + 1
+                    chunk, carry = chunk[newline:], chunk[:newline]
+                found = regex.findall(chunk) + found
+        if len(found) == 0:
+            raise GrepError("Could not find energy in OUTCAR")
+        return array([float(u) for u in found[-n:]]) * eV
+
     @property
     @make_cached
     def total_energy(self):
@@ -31,6 +31,9 @@ from ..misc import add_setter
 from .extract import Extract as ExtractVasp
 from pylada.misc import testValidProgram
 
+_WRITE_BUFFER = 1 << 20
+""" Buffer size for input files, so that each is written in as few calls as possible. """
+
 
 class Vasp(AttrBlock):
     """ Interface to VASP code.
@@ -945,8 +948,8 @@ class Vasp(AttrBlock):
         from ..process.program import ProgramProcess
         from .extract import Extract as ExtractVasp
 
-        logger.info('vasp/functional iter: outdir: %s' % outdir)
-        logger.debug('vasp/functional iter: structure:\n%s' % repr(structure))
+        logger.info('vasp/functional iter: outdir: %s', outdir)
+        logger.debug('vasp/functional iter: structure:\n%r', structure)
 
         # check for pre-existing and successful run.
         if not overwrite:
@@ -999,24 +1002,24 @@ class Vasp(AttrBlock):
         from ..misc import chdir, local_path
         from . import files
 
-        logger.info('vasp/functional bringup: outdir: %s ' % outdir)
-        logger.debug('vasp/functional bringup: structure:\n%s' % repr(structure))
-        logger.debug('vasp/functional bringup: kwargs: %s' % repr(kwargs))
+        logger.info('vasp/functional bringup: outdir: %s ', outdir)
+        logger.debug('vasp/functional bringup: structure:\n%r', structure)
+        logger.debug('vasp/functional bringup: kwargs: %r', kwargs)
 
         with chdir(outdir):
             # creates INCAR file (and POSCAR via istruc).
             fpath = join(outdir, files.INCAR)
-            logger.debug("vasp/functional bringup: incar fpath: %s " % fpath)
+            logger.debug("vasp/functional bringup: incar fpath: %s ", fpath)
             self.write_incar(structure, path=fpath, outdir=outdir, **kwargs)
 
             # creates kpoints file
-            logger.debug("vasp/functional bringup: files.KPOINTS: %s " % files.KPOINTS)
-            with open(files.KPOINTS, "w") as kp_file:
+            logger.debug("vasp/functional bringup: files.KPOINTS: %s ", files.KPOINTS)
+            with open(files.KPOINTS, "w", buffering=_WRITE_BUFFER) as kp_file:
                 self.write_kpoints(kp_file, structure)
 
             # creates POTCAR file
-            logger.debug("vasp/functional bringup: files.POTCAR: %s " % files.POTCAR)
-            with open(files.POTCAR, 'w') as potcar:
+            logger.debug("vasp/functional bringup: files.POTCAR: %s ", files.POTCAR)
+            with open(files.POTCAR, 'w', buffering=_WRITE_BUFFER) as potcar:
                 self.write_potcar(potcar, structure)
 
             # Add is running file marker.
@@ -1045,7 +1048,7 @@ class Vasp(AttrBlock):
         from os import remove
         from ..misc import chdir
 
-        logger.info('vasp/functional bringdown: directory: %s ' % directory)
+        logger.info('vasp/functional bringdown: directory: %s ', directory)
 
         with chdir(directory):
             with open('pylada.FUNCTIONAL', 'w') as fout:
@@ -1060,16 +1063,16 @@ class Vasp(AttrBlock):
         from ..misc import RelativePath
         from .files import INCAR
 
-        logger.debug("vasp/functional write_incar: path: %s " % path)
-        logger.debug("vasp/functional write_incar: structure:\n%s" % repr(structure))
-        logger.debug("vasp/functional write_incar: kwargs: %s" % repr(kwargs))
+        logger.debug("vasp/functional write_incar: path: %s ", path)
+        logger.debug("vasp/functional write_incar: structure:\n%r", structure)
+        logger.debug("vasp/functional write_incar: kwargs: %r", kwargs)
 
         # check what type path is.
         # if not a file, opens one an does recurrent call.
         if path is None:
             path = INCAR
         if not hasattr(path, "write"):
-            with open(RelativePath(path).path, "w") as file:
+            with open(RelativePath(path).path, "w", buffering=_WRITE_BUFFER) as file:
                 self.write_incar(structure, path=file, **kwargs)
             return
         if kwargs.get('outdir', None) is None:
@@ -1096,8 +1099,8 @@ class Vasp(AttrBlock):
 
     def write_kpoints(self, file, structure, kpoints=None):
         """ Writes kpoints to a stream. """
-        logger.info("vasp/functional write_kpoints: file: %s " % file)
-        logger.debug("vasp/functional write_kpoints: kpoints: %s " % kpoints)
+        logger.info("vasp/functional write_kpoints: file: %s ", file)
+        logger.debug("vasp/functional write_kpoints: kpoints: %s ", kpoints)
 
         if kpoints == None:
             kpoints = self.kpoints
@@ -33,44 +33,105 @@
 """
 __docformat__ = "restructuredtext en"
 __all__ = ['relax', 'iter_relax', 'Relax', 'epitaxial', 'iter_epitaxial', 'RelaxExtract']
+import re
+from functools import lru_cache
 from ..vasp import logger
 from ..tools.makeclass import makeclass, makefunc
 from .functional import Vasp
 from .extract import Extract, MassExtract
 
+_INITIAL_STRUCTURE_RE = re.compile(rb'#+ INITIAL STRUCTURE #+\n.*?\n#+ END INITIAL STRUCTURE #+',
+                                   re.DOTALL)
+""" Initial structure block which Pylada appends to OUTCAR files. """
+_step_name = "{0:0<12.10}".format
+""" Name of the directory of an epitaxial step, from the strain. """
+
 
 class RelaxExtract(Extract):
     """ Extractor class for vasp relaxations. """
     class IntermediateMassExtract(MassExtract):
         """ Focuses on intermediate steps. """
+        _steps = 'relax_cellshape', 'relax_ions'
+        """ Subdirectories holding intermediate steps. """
 
         def __iter_alljobs__(self):
-            """ Goes through all directories with an OUTVAR. """
-            from glob import iglob
-            from os.path import relpath, join, exists
-            from itertools import chain
-
-            for dir in chain(iglob(join(self.rootpath, 'relax_cellshape', '*/')),
-                             iglob(join(self.rootpath, 'relax_ions', '*/'))):
-                if not exists(join(self.rootpath, dir, 'OUTCAR')):
-                    continue
+            """ Goes through all directories with an OUTVAR.
+
+                The step directories are listed on each call, but only sorted and
+                matched to extractors anew when the set of directories or the root
+                path changes, or after :py:meth:`uncache`. Directories which did
+                not yet hold an OUTCAR are checked again on each call.
+            """
+            from os.path import relpath, join
+
+            entries = self._step_entries()
+            key = self.rootpath, frozenset(entry.path for entry in entries)
+            cache = self.__dict__.get('_steps_cache')
+            if cache is None or cache[0] != key:
+                # keeps extractors of steps which were already listed.
+                previous = {} if cache is None else dict(cache[1])
+                # running steps are generally the latest ones.
+                entries.sort(key=lambda entry: entry.stat(follow_symlinks=False).st_mtime,
+                             reverse=True)
+                cache = key, [[entry.path, previous.get(entry.path)] for entry in entries]
+                self.__dict__['_steps_cache'] = cache
+
+            for item in cache[1]:
+                if item[1] is None:
+                    item[1] = self._step_extract(item[0])
+
+            for dir, result in cache[1]:
+                if result is not None:
+                    yield join('/', relpath(dir, self.rootpath)), result
+
+        def uncache(self):
+            """ Uncache values, including the listing of step directories. """
+            super(RelaxExtract.IntermediateMassExtract, self).uncache()
+            self.__dict__.pop('_steps_cache', None)
+
+        def _step_entries(self):
+            """ Lists directories of intermediate steps. """
+            from os import scandir
+            from os.path import join
+
+            result = []
+            for step in self._steps:
                 try:
-                    result = Extract(dir[:-1])
-                except:
+                    entries = scandir(join(self.rootpath, step))
+                except FileNotFoundError:
                     continue
-                yield join('/', relpath(dir[:-1], self.rootpath)), result
+                with entries:
+                    result.extend(entry for entry in entries
+                                  if entry.name[0] != '.'
+                                  and entry.is_dir(follow_symlinks=False))
+            return result
+
+        def _step_extract(self, directory):
+            """ Extractor for an intermediate step, or None if not available. """
+            from os.path import join, isfile
+            if not isfile(join(directory, 'OUTCAR')):
+                return None
+            try:
+                return Extract(directory)
+            except:
+                return None
 
     @property
     def details(self):
-        """ Intermediate steps. """
-        if '_details' not in self.__dict__:
+        """ Intermediate steps.
+
+            The intermediate extractor is created once. It is dynamic, so that new
+            steps are picked up when polling a running job.
+        """
+        details = self.__dict__.get('_details', None)
+        if details is None:
             from os.path import exists
             if not exists(self.directory):
                 return None
-            self.__dict__['_details'] = None
-            self._details = self.IntermediateMassExtract(self.directory)
+            details = self.IntermediateMassExtract(self.directory, dynamic=True)
             """ List of intermediate calculation extractors. """
-        return self._details
+            self.__dict__['_details'] = details
+        return details
 
     def files(self, **kwargs):
         """ Iterates over input/output files. """
@@ -90,12 +151,10 @@ class RelaxExtract(Extract):
             currently running.
         """
         from os.path import join, exists
-        is_run = exists(join(self.directory, '.pylada_is_running'))
-        if not is_run:
-            for value in self.details.values():
-                if value.is_running:
-                    is_run = True
-        return is_run
+        if exists(join(self.directory, '.pylada_is_running')):
+            return True
+        details = self.details
+        return details is not None and any(value.is_running for value in details.values())
 
 # colton_mod: Change maxcalls to 20 as it seems hardcoded without a way to change it.
 # The vasp.maxiter line in HT_relax does not appear to do anything as there is no maxiter.
@@ -177,37 +236,39 @@ def iter_relax(vasp, structure, outdir=None, first_trial=None,
                  detailing the call to the external VASP program.
     """
     from re import sub
-    from copy import deepcopy
     from os import getcwd
     from os.path import join
+    from collections import ChainMap
     from shutil import rmtree
     from ..misc import RelativePath
+    from logging import DEBUG
     from ..error import ExternalRunFailed
 
-    logger.debug("vasp/relax: iter_relax: entry.  type(vasp): %s" % (type(vasp)))
-    logger.debug('vasp/relax: iter_relax: entry. === start vasp:\n%s' % repr(vasp))
-    logger.debug('===== end vasp')
-    logger.debug('vasp/relax: iter_relax: entry. structure:\n%s' % structure)
-    logger.debug('vasp/relax: iter_relax: type(structure): %s' % type(structure))
-    logger.debug('vasp/relax: iter_relax: entry.  outdir: %s' % outdir)
-    logger.debug('vasp/relax: iter_relax: entry.  first_trial: %s' % first_trial)
-    logger.debug('vasp/relax: iter_relax: entry.  maxcalls: %s' % maxcalls)
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("vasp/relax: iter_relax: entry.  type(vasp): %s", type(vasp))
+        logger.debug('vasp/relax: iter_relax: entry. === start vasp:\n%r', vasp)
+        logger.debug('===== end vasp')
+        logger.debug('vasp/relax: iter_relax: entry. structure:\n%s', structure)
+        logger.debug('vasp/relax: iter_relax: type(structure): %s', type(structure))
+    logger.debug('vasp/relax: iter_relax: entry.  outdir: %s', outdir)
+    logger.debug('vasp/relax: iter_relax: entry.  first_trial: %s', first_trial)
+    logger.debug('vasp/relax: iter_relax: entry.  maxcalls: %s', maxcalls)
     # colton_mod_start: Print warning for maxcalls/maxiter
     logger.warning('vasp/relax: iter_relax: entry.  Setting maxcalls with maxiter does not work!!! It is hardcoded into vasp.relax.iter_relax')
     # colton_mod_end
-    logger.debug('vasp/relax: iter_relax: entry.  keepsteps: %s' % keepsteps)
-    logger.debug('vasp/relax: iter_relax: entry.  nofail: %s' % nofail)
-    logger.debug('vasp/relax: iter_relax: entry.  convergence: %s' % convergence)
-    logger.debug('vasp/relax: iter_relax: entry.  minrelsteps: %s' % minrelsteps)
-    logger.debug('vasp/relax: iter_relax: entry.  kwargs: %s' % kwargs)
+    logger.debug('vasp/relax: iter_relax: entry.  keepsteps: %s', keepsteps)
+    logger.debug('vasp/relax: iter_relax: entry.  nofail: %s', nofail)
+    logger.debug('vasp/relax: iter_relax: entry.  convergence: %s', convergence)
+    logger.debug('vasp/relax: iter_relax: entry.  minrelsteps: %s', minrelsteps)
+    logger.debug('vasp/relax: iter_relax: entry.  kwargs: %s', kwargs)
 
     # make this function stateless.
-    vasp = deepcopy(vasp)
+    vasp = _copy_functional(vasp)
     relaxed_structure = structure.copy()
     if first_trial is None:
         first_trial = {}
     outdir = getcwd() if outdir is None else RelativePath(outdir).path
-    logger.debug("vasp/relax: iter_relax: final outdir: %s\n" % outdir)
+    logger.debug("vasp/relax: iter_relax: final outdir: %s\n", outdir)
     # .../mos2_024000/mos2_024000.cif/non-magnetic
 
     # convergence criteria and behavior.
@@ -217,45 +278,49 @@ def iter_relax(vasp, structure, outdir=None, first_trial=None,
 
     # number of restarts.
     nb_steps, output = 0, None
+    # convergence of current output, or None if it has not been checked yet.
+    isConv = True
 
     # sets parameter dictionary for first trial.
-    if first_trial is not None:
-        params = kwargs.copy()
-        params.update(first_trial)
-    else:
-        params = kwargs
+    # The ChainMap is a view of kwargs, so the relaxation popped below is gone
+    # from it as well.
+    params = ChainMap(first_trial, kwargs) if first_trial else kwargs
 
     # defaults to vasp.relaxation
     relaxation = kwargs.pop('relaxation', vasp.relaxation)
     # could be that relaxation comes from vasp.relaxation which is a tuple.
     if isinstance(relaxation, tuple):
-        vasp = deepcopy(vasp)
         vasp.relaxation = relaxation
         relaxation = relaxation[0]
     # cellshape ionic volume
-
-    # performs cellshape relaxation calculations.
-    while (maxcalls <= 0 or nb_steps < maxcalls) and relaxation.find("cellshape") != -1:
+    has_cellshape = "cellshape" in relaxation
+    has_ionic = "ionic" in relaxation
+    has_gw = "relgw" in relaxation
+
+    # stage directories are <root><nb_steps>: build the roots only once.
+    cell_root = join(outdir, "relax_cellshape", "")
+    ions_root = join(outdir, "relax_ions", "")
+    gw_root = join(outdir, "relax_gwcalc", "")
+
+    def run_stage(root, stage_relaxation):
+        """ Performs one VASP calculation in directory ``root + str(nb_steps)``. """
+        nonlocal output, isConv, relaxed_structure, nb_steps
         # Invokes vasp/functional.Vasp.__init__
         # and vasp/functional: iter, which calls bringup,
         # which calls write_incar, write_kpoints, etc.
-        fulldir = join(outdir, "relax_cellshape", str(nb_steps))
-        for u in vasp.iter\
-                (
-                    relaxed_structure,
-                    outdir=fulldir,
-                    restart=output,
-                    relaxation=relaxation,
-                    **params
-                ):
-            yield u
-
-        output = vasp.Extract(join(outdir, "relax_cellshape", str(nb_steps)))
-        if not output.success:
-            ExternalRunFailed("VASP calculations did not complete.")
+        # The next stage cannot be brought up ahead of time: its structure and
+        # restart files come from this stage's output, and Vasp.bringup works through
+        # chdir, which changes the cwd of the whole process, so it is unsafe in
+        # a background thread.
+        output = yield from _run_vasp(vasp, relaxed_structure, root + str(nb_steps),
+                                      restart=output, relaxation=stage_relaxation, **params)
+        isConv = None
         relaxed_structure = output.structure
-
         nb_steps += 1
+
+    # performs cellshape relaxation calculations.
+    while has_cellshape and (maxcalls <= 0 or nb_steps < maxcalls):
+        yield from run_stage(cell_root, relaxation)
         if nb_steps == 1 and len(first_trial) != 0:
             params = kwargs
             continue
@@ -265,28 +330,14 @@ def iter_relax(vasp, structure, outdir=None, first_trial=None,
             break
 
     # Does not perform ionic calculation if convergence not reached.
-    if nofail == False and is_converged(output) == False:
+    if isConv is None:
+        isConv = is_converged(output)
+    if nofail == False and isConv == False:
         raise ExternalRunFailed("Could not converge cell-shape in {0} iterations.".format(maxcalls))
 
     # performs ionic calculation.
-    while (maxcalls <= 0 or nb_steps < maxcalls + 1) and relaxation.find("ionic") != -1:
-        fulldir = join(outdir, "relax_ions", str(nb_steps))
-        for u in vasp.iter\
-                (
-                    relaxed_structure,
-                    outdir=fulldir,
-                    relaxation="ionic",
-                    restart=output,
-                    **params
-                ):
-            yield u
-
-        output = vasp.Extract(join(outdir, "relax_ions", str(nb_steps)))
-        if not output.success:
-            ExternalRunFailed("VASP calculations did not complete.")
-        relaxed_structure = output.structure
-
-        nb_steps += 1
+    while has_ionic and (maxcalls <= 0 or nb_steps < maxcalls + 1):
+        yield from run_stage(ions_root, "ionic")
         if nb_steps == 1 and len(first_trial) != 0:
             params = kwargs
             continue
@@ -303,29 +354,13 @@ def iter_relax(vasp, structure, outdir=None, first_trial=None,
 
     # gwmod: same while loop as above, but with relaxation="gwcalc"
     # performs gwcalc calculation, at most once
-    if (maxcalls <= 0 or nb_steps < maxcalls + 2) \
-            and relaxation.find("relgw") != -1:
-
-        fulldir = join(outdir, "relax_gwcalc", str(nb_steps))
-        for u in vasp.iter\
-                (
-                    relaxed_structure,
-                    outdir=fulldir,
-                    relaxation="relgw",
-                    restart=output,
-                    **params
-                ):
-            yield u
-
-        output = vasp.Extract(join(outdir, "relax_gwcalc", str(nb_steps)))
-        if not output.success:
-            ExternalRunFailed("VASP calculations did not complete.")
-        relaxed_structure = output.structure
-
-        nb_steps += 1
+    if has_gw and (maxcalls <= 0 or nb_steps < maxcalls + 2):
+        yield from run_stage(gw_root, "relgw")
 
     # Does not perform static calculation if convergence not reached.
-    if nofail == False and is_converged(output) == False:
+    if isConv is None:
+        isConv = is_converged(output)
+    if nofail == False and isConv == False:
         raise ExternalRunFailed("Could not converge ions in {0} iterations.".format(maxcalls))
 
     # performs final calculation outside relaxation directory.
@@ -333,22 +368,10 @@ def iter_relax(vasp, structure, outdir=None, first_trial=None,
     # xxx skip if gwmod:
     # gwmod: if relaxation.find("relgw") == -1 ...
 
-    for u in vasp.iter\
-            (
-                relaxed_structure,
-                outdir=outdir,
-                relaxation="static",
-                restart=output,
-                **kwargs
-            ):
-        yield u
+    yield from _run_vasp(vasp, relaxed_structure, outdir,
+                         relaxation="static", restart=output, **kwargs)
 
-    output = vasp.Extract(outdir)
-    if not output.success:
-        ExternalRunFailed(
-            "VASP calculations did not complete.")
-
-    if output.success and (not keepsteps):
+    if not keepsteps:
         rmtree(join(outdir, "cellshape"))
         rmtree(join(outdir, "ions"))
 
@@ -365,6 +388,9 @@ Relax = makeclass('Relax', Vasp, iter_relax, None, module='pylada.vasp.relax',
 
 def _get_is_converged(vasp, structure, convergence=None, minrelsteps=-1, **kwargs):
     """ Returns convergence function. """
+    from os import stat
+    from os.path import basename, join
+    from numpy import abs, float64
     from ..error import ExternalRunFailed
     # tries and devine the convergence criteria from the input.
     if convergence is None:
@@ -373,44 +399,129 @@ def _get_is_converged(vasp, structure, convergence=None, minrelsteps=-1, **kwarg
         pass
     elif convergence > 0:
         convergence *= float(len(structure))
-    if convergence > 0 and convergence < vasp.ediff:
+    if not hasattr(convergence, "__call__") and 0 < convergence < vasp.ediff:
         raise ValueError("Energy convergence criteria ediffg({0}) is smaller than ediff({1})."
                          .format(vasp.ediffg, vasp.ediff))
-    # creates a convergence function.
+    # creates the criterion proper, with its constants resolved once and for all.
     if hasattr(convergence, "__call__"):
-        def is_converged(extractor):
-            if extractor is None:
-                return True
-            if not extractor.success:
-                raise ExternalRunFailed("VASP calculation did not succeed.")
-            i = int(extractor.directory.split('/')[-1]) + 1
-            if minrelsteps > 0 and minrelsteps > i:
-                return False
-            return convergence(extractor)
+        criterion = convergence
     elif convergence > 0e0:
+        def criterion(extractor):
+            energies = extractor.tail_total_energies(2)
+            if len(energies) < 2:
+                return True
+            return abs(energies[-2] - energies[-1]) < convergence
+    else:
+        convergence = float64(abs(convergence))
+
+        def criterion(extractor):
+            return abs(extractor.forces).max() < convergence
+    # and wraps it with the checks common to all criteria.
+    if minrelsteps > 0:
         def is_converged(extractor):
             if extractor is None:
                 return True
             if not extractor.success:
                 raise ExternalRunFailed("VASP calculation did not succeed.")
-            i = int(extractor.directory.split('/')[-1]) + 1
-            if minrelsteps > 0 and minrelsteps > i:
+            if minrelsteps > int(basename(extractor.directory)) + 1:
                 return False
-            if extractor.total_energies.shape[0] < 2:
-                return True
-            return abs(extractor.total_energies[-2] - extractor.total_energies[-1:]) < convergence
+            return criterion(extractor)
     else:
         def is_converged(extractor):
-            from numpy import max, abs, all
             if extractor is None:
                 return True
             if not extractor.success:
                 raise ExternalRunFailed("VASP calculation did not succeed.")
-            i = int(extractor.directory.split('/')[-1]) + 1
-            if minrelsteps > 0 and minrelsteps > i:
-                return False
-            return all(max(abs(extractor.forces)) < abs(convergence))
-    return is_converged
+            return criterion(extractor)
+
+    # the same output is often checked more than once: remembers the verdict for
+    # as long as its OUTCAR is not modified.
+    verdicts = {}
+
+    def memoized(extractor):
+        if extractor is None:
+            return True
+        try:
+            key = extractor.directory, \
+                stat(join(extractor.directory, extractor.OUTCAR)).st_mtime_ns
+        except (AttributeError, OSError):
+            return is_converged(extractor)
+        if key not in verdicts:
+            verdicts[key] = is_converged(extractor)
+        return verdicts[key]
+    return memoized
+
+
+def _copy_functional(vasp):
+    """ Copies functional without deep-copying it.
+
+        Only the keywords are copied, one level down, since setting an attribute
+        such as ``relaxation`` modifies other keywords as well (``isif``,
+        ``nsw``...). Values are not copied, nor are other attributes such as
+        ``species``: they are shared with the input functional and should not be
+        modified in place. :py:meth:`Vasp.iter` deep-copies the functional before
+        using it anyways.
+    """
+    from copy import copy
+    from ..tools import SuperCall
+    if isinstance(vasp, SuperCall):
+        return SuperCall(vasp.__dict__['_class'], _copy_functional(vasp.__dict__['_object']))
+    result = vasp.__class__.__new__(vasp.__class__)
+    result.__dict__.update(vasp.__dict__)
+    result.__dict__['_input'] = {key: copy(value) for key, value in vasp._input.items()}
+    return result
+
+
+@lru_cache(maxsize=256)
+def _resolve_outdir(outdir, cwd):
+    """ Absolute output directory, as given by :py:class:`RelativePath`.
+
+        Relative paths are resolved with respect to ``cwd``, which is only part
+        of the arguments so that the cache does not outlive a change of
+        directory.
+    """
+    from ..misc import RelativePath
+    return RelativePath(outdir).path
+
+
+def _run_vasp(vasp, structure, outdir, **kwargs):
+    """ Delegates to :py:meth:`Vasp.iter`, returning the final extraction object.
+
+        Meant to be used as ``output = yield from _run_vasp(...)``. The extraction
+        object yielded last by :py:meth:`Vasp.iter` is returned as is.
+
+        :raises ExternalRunFailed: if the calculation did not complete.
+    """
+    from ..error import ExternalRunFailed
+    last = None
+    for last in vasp.iter(structure, outdir=outdir, **kwargs):
+        yield last
+    output = last if isinstance(last, Extract) else vasp.Extract(outdir)
+    if not output.success:
+        raise ExternalRunFailed("VASP calculations in {0} did not complete.".format(outdir))
+    return output
+
+
+def _interpolated_root(xa, fa, xb, fb, xc=None, fc=None):
+    """ Estimates the zero of a function from two or three points.
+
+        Uses inverse quadratic interpolation when given three points with
+        distinct values, and the secant method otherwise.
+
+        :returns: the estimate if it falls strictly within the bracket ``[xa,
+           xb]``, and None otherwise.
+    """
+    if xc is not None and fa != fb and fa != fc and fb != fc:
+        x = xa * fb * fc / ((fa - fb) * (fa - fc))                                 \
+            + xb * fa * fc / ((fb - fa) * (fb - fc))                               \
+            + xc * fa * fb / ((fc - fa) * (fc - fb))
+    elif fa != fb:
+        x = xb - fb * (xb - xa) / (fb - fa)
+    else:
+        return None
+    if not min(xa, xb) < x < max(xa, xb):
+        return None
+    return x
 
 
 def iter_epitaxial(vasp, structure, outdir=None, direction=[0, 0, 1], epiconv=1e-4,
@@ -425,9 +536,10 @@ def iter_epitaxial(vasp, structure, outdir=None, direction=[0, 0, 1], epiconv=1e
 
         Since VASP does not intrinsically allow for such a relaxation, it is
         performed by chaining different vasp calculations together. The
-        minimization procedure itself is the secant method, enhanced by the
-        knowledge of the stress tensor. The last calculation is static, for
-        maximum accuracy.
+        minimization procedure first brackets the zero of the stress in the
+        epitaxial direction, and then narrows the bracket using inverse quadratic
+        interpolation of the stress, falling back on bisection when needed. The
+        last calculation is static, for maximum accuracy.
 
         :param vasp: 
           :py:class:`Vasp <pylada.vasp.functional.Vasp>` functional with wich to
@@ -451,17 +563,16 @@ def iter_epitaxial(vasp, structure, outdir=None, direction=[0, 0, 1], epiconv=1e
     """
     from os import getcwd
     from os.path import join
-    from copy import deepcopy
-    from re import sub
+    from mmap import mmap, ACCESS_READ
     from numpy.linalg import norm
-    from numpy import array, dot
+    from numpy import array, dot, identity, outer
 
     direction = array(direction, dtype='float64') / norm(direction)
     if outdir is None:
         outdir = getcwd()
 
     # creates relaxation functional.
-    vasp = deepcopy(vasp)
+    vasp = _copy_functional(vasp)
     kwargs.pop('relaxation', None)
     vasp.relaxation = 'ionic'
     vasp.encut = 1.4
@@ -476,14 +587,17 @@ def iter_epitaxial(vasp, structure, outdir=None, direction=[0, 0, 1], epiconv=1e
 
     allcalcs = []
 
+    # strain projector and initial positions do not change from call to call.
+    projector = outer(direction, direction)
+    positions = array([atom.pos for atom in structure], dtype='float64').reshape(-1, 3)
+
     def change_structure(x):
         """ Creates new structure with input change in c. """
-        from numpy import outer
         newstruct = structure.copy()
-        strain = outer(direction, direction) * x
-        newstruct.cell += dot(strain, structure.cell)
-        for atom in newstruct:
-            atom.pos += dot(strain, atom.pos)
+        deformation = identity(3) + projector * x
+        newstruct.cell = dot(deformation, structure.cell)
+        for atom, pos in zip(newstruct, dot(positions, deformation.T)):
+            atom.pos[:] = pos
         return newstruct
 
     def component(stress):
@@ -494,51 +608,69 @@ def iter_epitaxial(vasp, structure, outdir=None, direction=[0, 0, 1], epiconv=1e
     # To do this, we start from current structure, look at stress in relevant
     # direction for the direction in which to search, and expand/contract in that direction.
     xstart = 0.0
+    fulldir = join(outdir, "relax_ions", _step_name(xstart))
     for u in vasp.iter(change_structure(xstart),
-                       outdir=join(outdir, "relax_ions", "{0:0<12.10}".format(xstart)),
+                       outdir=fulldir,
                        restart=None if len(allcalcs) == 0 else allcalcs[-1],
                        **kwargs):
                             yield u
-    estart = vasp.Extract(join(outdir, 'relax_ions', '{0:0<12.10}'.format(xstart)))
+    estart = vasp.Extract(fulldir)
     allcalcs.append(estart)
 
     # then checks stress for actual direction to look at.
     stress_direction = 1.0 if component(allcalcs[-1].stress) > 0e0 else -1.0
     xend = initstep if stress_direction > 0e0 else -initstep
     # compute xend value.
+    fulldir = join(outdir, "relax_ions", _step_name(xend))
     for u in vasp.iter(change_structure(xend),
-                       outdir=join(outdir, "relax_ions", "{0:0<12.10}".format(xend)),
+                       outdir=fulldir,
                        restart=None if len(allcalcs) == 0 else allcalcs[-1],
                        **kwargs):
                             yield u
-    eend = vasp.Extract(join(outdir, 'relax_ions', '{0:0<12.10}'.format(xend)))
+    eend = vasp.Extract(fulldir)
     allcalcs.append(eend)
     # make sure xend is on other side of stress tensor sign.
     while stress_direction * component(allcalcs[-1].stress) > 0e0:
         xstart, estart = xend, eend
         xend += initstep if stress_direction > 0e0 else -initstep
+        fulldir = join(outdir, "relax_ions", _step_name(xend))
         for u in vasp.iter(change_structure(xend),
-                           outdir=join(outdir, "relax_ions", "{0:0<12.10}".format(xend)),
+                           outdir=fulldir,
                            restart=None if len(allcalcs) == 0 else allcalcs[-1],
                            **kwargs):
                                 yield u
-        eend = vasp.Extract(join(outdir, 'relax_ions', '{0:0<12.10}'.format(xend)))
+        eend = vasp.Extract(fulldir)
         allcalcs.append(eend)
 
-    # now we have a bracket. We start bisecting it.
+    # now we have a bracket. We shrink it by interpolating the stress, as in
+    # Brent's method. Bisection is used whenever interpolation fails to halve
+    # the bracket.
+    fstart, fend = float(component(estart.stress)), float(component(eend.stress))
+    xlast, flast = None, None
+    previous_width = 2e0 * abs(xend - xstart)
     while abs(estart.total_energy - eend.total_energy) > epiconv * float(len(structure)):
-        xmid = 0.5 * (xend + xstart)
+        width = abs(xend - xstart)
+        xmid = None
+        if width <= 0.5 * previous_width:
+            xmid = _interpolated_root(xstart, fstart, xend, fend, xlast, flast)
+        if xmid is None:
+            xmid = 0.5 * (xend + xstart)
+        previous_width = width
+        fulldir = join(outdir, "relax_ions", _step_name(xmid))
         for u in vasp.iter(change_structure(xmid),
-                           outdir=join(outdir, "relax_ions", "{0:0<12.10}".format(xmid)),
+                           outdir=fulldir,
                            restart=None if len(allcalcs) == 0 else allcalcs[-1],
                            **kwargs):
                                 yield u
-        emid = vasp.Extract(join(outdir, 'relax_ions', '{0:0<12.10}'.format(xmid)))
+        emid = vasp.Extract(fulldir)
         allcalcs.append(emid)
-        if stress_direction * component(emid.stress) > 0:
-            xstart, estart = xmid, emid
+        fmid = float(component(emid.stress))
+        if stress_direction * fmid > 0:
+            xlast, flast = xstart, fstart
+            xstart, estart, fstart = xmid, emid, fmid
         else:
-            xend, eend = xmid, emid
+            xlast, flast = xend, fend
+            xend, eend, fend = xmid, emid, fmid
 
     # last two calculation: relax mid-point of xstart, xend, then  perform static.
     efinal = eend if estart.total_energy > eend.total_energy else estart
@@ -551,14 +683,16 @@ def iter_epitaxial(vasp, structure, outdir=None, direction=[0, 0, 1], epiconv=1e
     # Caution: this edits OUTCAR, overwrites OUTCAR, rewrites OUTCAR.
     with final.__outcar__() as file:
         filename = file.name
-        string = sub('#+ INITIAL STRUCTURE #+\n((.|\n)*)\n#+ END INITIAL STRUCTURE #+',
-                     """################ INITIAL STRUCTURE ################\n"""
-                     """from {0.__class__.__module__} import {0.__class__.__name__}\n"""
-                     """structure = {1}\n"""
-                     """################ END INITIAL STRUCTURE ################\n"""
-                     .format(structure, repr(structure).replace('\n', '\n            ')),
-                     file.read())
-    with open(filename, 'w') as file:
+    replacement = ("""################ INITIAL STRUCTURE ################\n"""
+                   """from {0.__class__.__module__} import {0.__class__.__name__}\n"""
+                   """structure = {1}\n"""
+                   """################ END INITIAL STRUCTURE ################\n"""
+                   .format(structure, repr(structure).replace('\n', '\n            '))
+                   .encode())
+    with open(filename, 'rb') as file:
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as outcar:
+            string = _INITIAL_STRUCTURE_RE.sub(lambda match: replacement, outcar)
+    with open(filename, 'wb') as file:
         file.write(string)
 
     # yields final extraction object.
@@ -576,6 +710,7 @@ epitaxial = makefunc('epitaxial', iter_epitaxial, module='pylada.vasp.relax')
 def iter_training(vasp, structure, outdir=None, first_trial=None,
                maxcalls=50, nofail=False,
                convergence=None, minrelsteps=-1,
+               skip_ions_if_converged=False,
                **kwargs):
     """ Iterator over calls to VASP during relaxation.
 
@@ -592,6 +727,11 @@ def iter_training(vasp, structure, outdir=None, first_trial=None,
         convergence criteria is achieved. Finally, a static calculation is
         performed.
 
+        Each calculation restarts from the previous one: with the default
+        ``istart`` and ``icharg`` settings, its WAVECAR and CHGCAR are copied over
+        and read in. They are copied rather than linked, since VASP rewrites
+        them in place.
+
         It is possible to bypass cell-shape relaxations and perform only
         ionic-relaxations.
 
@@ -639,6 +779,11 @@ def iter_training(vasp, structure, outdir=None, first_trial=None,
             then the calls occur during the ionic relaxations. The calls do count
             towards ``maxcalls``.
           * negative (default): argument is ignored.
+        :param bool skip_ions_if_converged:
+          If True, the ionic relaxation which follows a cell-shape
+          relaxation is skipped once the latter has converged (and at least
+          ``minrelsteps`` calls were made). If False (default), every
+          cell-shape relaxation is followed by an ionic one.
         :param kwargs:
           Other parameters are applied to the input
           :py:class:`~pylada.vasp.functional.Vasp` object.
@@ -649,32 +794,35 @@ def iter_training(vasp, structure, outdir=None, first_trial=None,
                  detailing the call to the external VASP program.
     """
     from re import sub
-    from copy import deepcopy
+    from itertools import count
     from os import getcwd
     from os.path import join
     from shutil import rmtree
-    from ..misc import RelativePath
+    from logging import DEBUG
     from ..error import ExternalRunFailed
 
-    logger.debug("vasp/relax: iter_training: entry.  type(vasp): %s" % (type(vasp)))
-    logger.debug('vasp/relax: iter_training: entry. === start vasp:\n%s' % repr(vasp))
-    logger.debug('===== end vasp')
-    logger.debug('vasp/relax: iter_training: entry. structure:\n%s' % structure)
-    logger.debug('vasp/relax: iter_training: type(structure): %s' % type(structure))
-    logger.debug('vasp/relax: iter_training: entry.  outdir: %s' % outdir)
-    logger.debug('vasp/relax: iter_training: entry.  maxcalls: %s' % maxcalls)
-    logger.debug('vasp/relax: iter_training: entry.  nofail: %s' % nofail)
-    logger.debug('vasp/relax: iter_training: entry.  convergence: %s' % convergence)
-    logger.debug('vasp/relax: iter_relax: entry.  minrelsteps: %s' % minrelsteps)
-    logger.debug('vasp/relax: iter_training: entry.  kwargs: %s' % kwargs)
-
-    # make this function stateless.
-    vasp = deepcopy(vasp)
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("vasp/relax: iter_training: entry.  type(vasp): %s", type(vasp))
+        logger.debug('vasp/relax: iter_training: entry. === start vasp:\n%r', vasp)
+        logger.debug('===== end vasp')
+        logger.debug('vasp/relax: iter_training: entry. structure:\n%s', structure)
+        logger.debug('vasp/relax: iter_training: type(structure): %s', type(structure))
+        logger.debug('vasp/relax: iter_training: entry.  outdir: %s', outdir)
+        logger.debug('vasp/relax: iter_training: entry.  maxcalls: %s', maxcalls)
+        logger.debug('vasp/relax: iter_training: entry.  nofail: %s', nofail)
+        logger.debug('vasp/relax: iter_training: entry.  convergence: %s', convergence)
+        logger.debug('vasp/relax: iter_training: entry.  minrelsteps: %s', minrelsteps)
+        logger.debug('vasp/relax: iter_training: entry.  kwargs: %s', kwargs)
+
+    # make this function stateless: only vasp.relaxation and the input
+    # keywords are ever modified, and those are copied.
+    vasp = _copy_functional(vasp)
     relaxed_structure = structure.copy()
     if first_trial is None:
         first_trial = {}
-    outdir = getcwd() if outdir is None else RelativePath(outdir).path
-    logger.debug("vasp/relax: iter_training: final outdir: %s\n" % outdir)
+    cwd = getcwd()
+    outdir = cwd if outdir is None else _resolve_outdir(outdir, cwd)
+    logger.debug("vasp/relax: iter_training: final outdir: %s\n", outdir)
 
     # convergence criteria and behavior.
     is_converged = _get_is_converged(
@@ -688,36 +836,20 @@ def iter_training(vasp, structure, outdir=None, first_trial=None,
     relaxation = kwargs.pop('relaxation', vasp.relaxation)
     # could be that relaxation comes from vasp.relaxation which is a tuple.
     if isinstance(relaxation, tuple):
-        vasp = deepcopy(vasp)
         vasp.relaxation = relaxation
         relaxation = relaxation[0]
 
     # performs cellshape relaxation calculations.
-    while (maxcalls <= 0 or nb_steps < maxcalls):
-        # sets parameter dictionary for cellshape relaxations
-        # using existing first_trial dictionary attribute
-        if first_trial is not None:
-            params = kwargs.copy()
-            params.update(first_trial)
-        else:
-            params = kwargs
+    # each pass makes two calls to VASP, a cell-shape and an ionic one.
+    for _ in count() if maxcalls <= 0 else range(0, maxcalls, 2):
+        # first_trial parameters only apply to the very first calculation.
+        params = {**kwargs, **first_trial} if (nb_steps == 0 and first_trial) else kwargs
         # Invokes vasp/functional.Vasp.__init__
         # and vasp/functional: iter, which calls bringup,
         # which calls write_incar, write_kpoints, etc.
-        fulldir = join(outdir, "relax_cellshape", str(nb_steps))
-        for u in vasp.iter\
-                (
-                    relaxed_structure,
-                    outdir=fulldir,
-                    restart=output,
-                    relaxation=relaxation,
-                    **params
-                ):
-            yield u
-
-        output = vasp.Extract(join(outdir, "relax_cellshape", str(nb_steps)))
-        if not output.success:
-            ExternalRunFailed("VASP calculations did not complete.")
+        cellshape_dir = join(outdir, "relax_cellshape", str(nb_steps))
+        output = yield from _run_vasp(vasp, relaxed_structure, cellshape_dir,
+                                      restart=output, relaxation=relaxation, **params)
         relaxed_structure = output.structure
 
         nb_steps += 1
@@ -726,24 +858,13 @@ def iter_training(vasp, structure, outdir=None, first_trial=None,
         # check for cellshape convergence.
         # will return False if nb_steps < min_rel_steps.
         isConv = is_converged(output)
+        if skip_ions_if_converged and isConv and nb_steps >= minrelsteps:
+            break
         
         # performs ionic calculation.
-        if len(first_trial) != 0:
-            params = kwargs
-        fulldir = join(outdir, "relax_ions", str(nb_steps))
-        for u in vasp.iter\
-                (
-                    relaxed_structure,
-                    outdir=fulldir,
-                    relaxation="ionic",
-                    restart=output,
-                    **params
-                ):
-            yield u
-
-        output = vasp.Extract(join(outdir, "relax_ions", str(nb_steps)))
-        if not output.success:
-            ExternalRunFailed("VASP calculations did not complete.")
+        ions_dir = join(outdir, "relax_ions", str(nb_steps))
+        output = yield from _run_vasp(vasp, relaxed_structure, ions_dir,
+                                      relaxation="ionic", restart=output, **kwargs)
         relaxed_structure = output.structure
         
         nb_steps += 1
@@ -753,40 +874,25 @@ def iter_training(vasp, structure, outdir=None, first_trial=None,
 
 
 
-    # Raise error if convergence not reached.
-    if nofail == False and is_converged(output) == False:
-        raise ExternalRunFailed("Could not converge cell-shape in {0} iterations.".format(maxcalls))
-
     # xxxxxxxxxxxxxxxxx start here
     # xxx set INCAR parameters by:
     #  vasp._input['xxxxxfoobar'] = 'xxxxxFOOBAREDxxxxx'
     # Similarly, in the files test/highthroughput/input*.py,
     # one can use the same assignment.
 
-    
     # Does not perform static calculation if convergence not reached.
-    if nofail == False and is_converged(output) == False:
-        raise ExternalRunFailed("Could not converge ions in {0} iterations.".format(maxcalls))
+    converged = is_converged(output)
+    if nofail == False and not converged:
+        raise ExternalRunFailed("Could not converge cell-shape and ions in {0} iterations."
+                                .format(maxcalls))
 
     # performs final calculation outside relaxation directory.
 
     # xxx skip if gwmod:
     # gwmod: if relaxation.find("relgw") == -1 ...
 
-    for u in vasp.iter\
-            (
-                relaxed_structure,
-                outdir=outdir,
-                relaxation="static",
-                restart=output,
-                **kwargs
-            ):
-        yield u
-
-    output = vasp.Extract(outdir)
-    if not output.success:
-        ExternalRunFailed(
-            "VASP calculations did not complete.")
+    yield from _run_vasp(vasp, relaxed_structure, outdir,
+                         relaxation="static", restart=output, **kwargs)
 
     # yields final extraction object.
     yield iter_training.Extract(outdir)
@@ -798,5 +904,7 @@ iter_training.Extract = RelaxExtract
 training = makefunc('training', iter_training, module='pylada.vasp.relax')
 Training = makeclass('Training', Vasp, iter_training, None, module='pylada.vasp.relax',
                   doc='Functional form of the :py:class:`pylada.vasp.relax.iter_training` method.')
+# Training objects pickled before skip_ions_if_converged existed lack the attribute.
+Training.skip_ions_if_converged = False
 
 # colton_mod_end
@@ -83,3 +83,17 @@ def test_common():
     assert all(abs(a.kpoints - array([[0.25,  0.25,  0.25], [0.75, -0.25, -0.25]])) < 1e-8)
     assert all(abs(a.multiplicity - [96.0, 288.0]) < 1e-8)
     pylada.verbose_representation = True
+
+
+def test_success_is_rechecked_until_true(tmpdir):
+    from pylada.vasp import Extract
+
+    outcar = tmpdir.join('OUTCAR')
+    outcar.write('running\n')
+    a = Extract(directory=str(tmpdir))
+    assert not a.success
+
+    outcar.write('General timing and accounting informations for this job:\n', mode='a')
+    assert a.success
+    outcar.remove()
+    assert not a.success
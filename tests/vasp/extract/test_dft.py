@@ -60,6 +60,9 @@ def test_dft():
     assert a.total_energy.units == eV and abs(a.total_energy + 10.665642 * eV) < 1e-5
     assert a.total_energies.units == eV\
         and all(abs(a.total_energies - array([-10.659338, -10.66267, -10.665642]) * eV) < 1e-5)
+    assert a.tail_total_energies(2).units == eV\
+        and all(abs(a.tail_total_energies(2) - array([-10.66267, -10.665642]) * eV) < 1e-5)
+    assert all(abs(a.tail_total_energies(5) - a.total_energies) < 1e-8)
     assert a.fermi_energy.units == eV and abs(a.fermi_energy - 5.0616 * eV) < 1e-4
     try:
         a.moment
@@ -105,3 +108,24 @@ def test_dft():
     assert all([hasattr(b, 'force') for b in a.structure])\
         and all([b.force.units == a.forces.units for b in a.structure])\
         and all(abs(a.forces.magnitude - array([b.force for b in a.structure])) < 1e-8)
+
+
+def test_tail_total_energies_across_chunks(tmpdir):
+    from os.path import join, dirname
+    from numpy import all, abs
+    from pylada.vasp import Extract
+
+    # spreads ionic steps further apart than the size of the chunks read backwards.
+    with open(join(dirname(__file__), 'data', 'COMMON')) as file:
+        lines = file.readlines()
+    with open(str(tmpdir.join('OUTCAR')), 'w') as file:
+        for line in lines:
+            file.write(line)
+            if 'energy  without entropy=' in line:
+                file.write(' padding\n' * 20000)
+
+    a = Extract(directory=str(tmpdir))
+    assert len(a.total_energies) == 3
+    assert all(abs(a.tail_total_energies(1) - a.total_energies[-1:]) < 1e-8)
+    assert all(abs(a.tail_total_energies(2) - a.total_energies[-2:]) < 1e-8)
+    assert all(abs(a.tail_total_energies(5) - a.total_energies) < 1e-8)
@@ -0,0 +1,46 @@
+###############################
+#  This file is part of PyLaDa.
+#
+#  Copyright (C) 2013 National Renewable Energy Lab
+#
+#  PyLaDa is a high throughput computational platform for Physics. It aims to make it easier to submit
+#  large numbers of jobs on supercomputers. It provides a python interface to physical input, such as
+#  crystal structures, as well as to a number of DFT (VASP, CRYSTAL) and atomic potential programs. It
+#  is able to organise and launch computational jobs on PBS and SLURM.
+#
+#  PyLaDa is free software: you can redistribute it and/or modify it under the terms of the GNU General
+#  Public License as published by the Free Software Foundation, either version 3 of the License, or (at
+#  your option) any later version.
+#
+#  PyLaDa is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even
+#  the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with PyLaDa.  If not, see
+#  <http://www.gnu.org/licenses/>.
+###############################
+from pytest import approx
+
+
+def test_secant():
+    from pylada.vasp.relax import _interpolated_root
+    assert _interpolated_root(0.0, 1.0, 1.0, -1.0) == approx(0.5)
+    assert _interpolated_root(0.0, 3.0, 1.0, -1.0) == approx(0.75)
+    assert _interpolated_root(0.0, 1.0, 1.0, 1.0) is None
+
+
+def test_inverse_quadratic():
+    from pylada.vasp.relax import _interpolated_root
+    # f(x) = 0.25 - x^2 is exactly quadratic in x about its root.
+    f = lambda x: 0.25 - x * x
+    x = _interpolated_root(0.0, f(0.0), 1.0, f(1.0), 2.0, f(2.0))
+    assert 0.0 < x < 1.0
+    assert abs(f(x)) < abs(f(_interpolated_root(0.0, f(0.0), 1.0, f(1.0))))
+
+
+def test_outside_bracket():
+    from pylada.vasp.relax import _interpolated_root
+    # both values are of the same sign: secant points outside the bracket.
+    assert _interpolated_root(0.0, 1.0, 1.0, 2.0) is None
+    # equal values at the bracket and third point: falls back on secant.
+    assert _interpolated_root(0.0, 1.0, 1.0, -1.0, 2.0, -1.0) == approx(0.5)
@@ -124,3 +124,13 @@ def test_ions_volume_fails(vasp):
     from pytest import raises
     with raises(ValueError):
         vasp.relaxation = "ions, volume"
+
+
+def test_copy_functional_leaves_original_alone(vasp):
+    from pylada.vasp.relax import _copy_functional
+    vasp.relaxation = 'cellshape'
+    other = _copy_functional(vasp)
+    other.relaxation = 'static'
+    check_cellshape(vasp)
+    assert other.relaxation == 'static'
+    assert other.species is vasp.species
@@ -0,0 +1,107 @@
+###############################
+#  This file is part of PyLaDa.
+#
+#  Copyright (C) 2013 National Renewable Energy Lab
+#
+#  PyLaDa is a high throughput computational platform for Physics. It aims to make it easier to submit
+#  large numbers of jobs on supercomputers. It provides a python interface to physical input, such as
+#  crystal structures, as well as to a number of DFT (VASP, CRYSTAL) and atomic potential programs. It
+#  is able to organise and launch computational jobs on PBS and SLURM.
+#
+#  PyLaDa is free software: you can redistribute it and/or modify it under the terms of the GNU General
+#  Public License as published by the Free Software Foundation, either version 3 of the License, or (at
+#  your option) any later version.
+#
+#  PyLaDa is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even
+#  the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with PyLaDa.  If not, see
+#  <http://www.gnu.org/licenses/>.
+###############################
+from pytest import fixture, mark, raises
+
+
+class Functional(object):
+    ediff = 1e-5
+    ediffg = None
+
+
+class Extractor(object):
+    def __init__(self, directory, energies=(-1.0, -1.0), forces=((0, 0, 0),), success=True):
+        from numpy import array
+        self.directory = directory
+        self.total_energies = array(energies)
+        self.forces = array(forces, dtype='float64')
+        self.success = success
+
+    def tail_total_energies(self, n=2):
+        return self.total_energies[-n:]
+
+
+@fixture
+def structure():
+    return [None, None]
+
+
+@mark.parametrize('convergence', [None, 1e-3, -1e-2, lambda extractor: True])
+def test_none_is_converged(structure, convergence):
+    from pylada.vasp.relax import _get_is_converged
+    is_converged = _get_is_converged(Functional(), structure, convergence=convergence)
+    assert is_converged(None)
+
+
+@mark.parametrize('convergence', [None, 1e-3, -1e-2, lambda extractor: True])
+def test_failure_raises(structure, convergence):
+    from pylada.vasp.relax import _get_is_converged
+    from pylada.error import ExternalRunFailed
+    is_converged = _get_is_converged(Functional(), structure, convergence=convergence)
+    with raises(ExternalRunFailed):
+        is_converged(Extractor('relax/0', success=False))
+
+
+def test_energy(structure):
+    from pylada.vasp.relax import _get_is_converged
+    is_converged = _get_is_converged(Functional(), structure, convergence=1e-3)
+    assert is_converged(Extractor('relax/0', energies=[-1.0]))
+    assert is_converged(Extractor('relax/0', energies=[-2.0, -1.0, -1.001]))
+    assert not is_converged(Extractor('relax/0', energies=[-1.0, -1.1]))
+
+
+def test_forces(structure):
+    from pylada.vasp.relax import _get_is_converged
+    is_converged = _get_is_converged(Functional(), structure, convergence=-1e-2)
+    assert is_converged(Extractor('relax/0', forces=[[0, 0, 1e-3], [0, -5e-3, 0]]))
+    assert not is_converged(Extractor('relax/0', forces=[[0, 0, 1e-3], [0, -5e-2, 0]]))
+
+
+def test_minrelsteps(structure):
+    from pylada.vasp.relax import _get_is_converged
+    is_converged = _get_is_converged(Functional(), structure, convergence=1e-3, minrelsteps=3)
+    assert not is_converged(Extractor('relax/1'))
+    assert is_converged(Extractor('relax/2'))
+
+
+def test_callable(structure):
+    from pylada.vasp.relax import _get_is_converged
+    is_converged = _get_is_converged(Functional(), structure, minrelsteps=2,
+                                     convergence=lambda extractor: len(extractor.total_energies) > 2)
+    assert not is_converged(Extractor('relax/0', energies=[-1.0, -1.0, -1.0]))
+    assert not is_converged(Extractor('relax/1', energies=[-1.0, -1.0]))
+    assert is_converged(Extractor('relax/1', energies=[-1.0, -1.0, -1.0]))
+
+
+def test_verdict_is_kept_until_outcar_changes(structure, tmpdir):
+    from os import utime
+    from pylada.vasp.relax import _get_is_converged
+    tmpdir.join('0', 'OUTCAR').ensure(file=True)
+    utime(str(tmpdir.join('0', 'OUTCAR')), ns=(0, 0))
+    extractor = Extractor(str(tmpdir.join('0')), energies=[-1.0, -1.1])
+    extractor.OUTCAR = 'OUTCAR'
+
+    is_converged = _get_is_converged(Functional(), structure, convergence=1e-3)
+    assert not is_converged(extractor)
+    extractor.total_energies = extractor.total_energies[:1]
+    assert not is_converged(extractor)
+    utime(str(tmpdir.join('0', 'OUTCAR')), ns=(10**9, 10**9))
+    assert is_converged(extractor)
@@ -0,0 +1,54 @@
+###############################
+#  This file is part of PyLaDa.
+#
+#  Copyright (C) 2013 National Renewable Energy Lab
+#
+#  PyLaDa is a high throughput computational platform for Physics. It aims to make it easier to submit
+#  large numbers of jobs on supercomputers. It provides a python interface to physical input, such as
+#  crystal structures, as well as to a number of DFT (VASP, CRYSTAL) and atomic potential programs. It
+#  is able to organise and launch computational jobs on PBS and SLURM.
+#
+#  PyLaDa is free software: you can redistribute it and/or modify it under the terms of the GNU General
+#  Public License as published by the Free Software Foundation, either version 3 of the License, or (at
+#  your option) any later version.
+#
+#  PyLaDa is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even
+#  the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with PyLaDa.  If not, see
+#  <http://www.gnu.org/licenses/>.
+###############################
+
+
+def test_details_picks_up_new_steps(tmpdir):
+    from pylada.vasp.relax import RelaxExtract
+
+    tmpdir.join('relax_cellshape', '0', 'OUTCAR').ensure(file=True)
+    tmpdir.join('relax_ions', '1').ensure(dir=True)
+
+    extract = RelaxExtract(str(tmpdir))
+    assert set(extract.details.keys()) == {'/relax_cellshape/0'}
+    assert extract.details is extract.details
+
+    # OUTCAR appears in a directory which was already listed.
+    tmpdir.join('relax_ions', '1', 'OUTCAR').ensure(file=True)
+    assert set(extract.details.keys()) == {'/relax_cellshape/0', '/relax_ions/1'}
+
+    # new step directory.
+    tmpdir.join('relax_ions', '2', 'OUTCAR').ensure(file=True)
+    assert set(extract.details.keys()) \
+        == {'/relax_cellshape/0', '/relax_ions/1', '/relax_ions/2'}
+
+
+def test_details_uncache(tmpdir):
+    from pylada.vasp.relax import RelaxExtract
+
+    tmpdir.join('relax_cellshape', '0', 'OUTCAR').ensure(file=True)
+
+    details = RelaxExtract(str(tmpdir)).details
+    first = details._extractors['/relax_cellshape/0']
+    assert details._extractors['/relax_cellshape/0'] is first
+    details.uncache()
+    assert '_steps_cache' not in details.__dict__
+    assert details._extractors['/relax_cellshape/0'] is not first
@@ -0,0 +1,115 @@
+###############################
+#  This file is part of PyLaDa.
+#
+#  Copyright (C) 2013 National Renewable Energy Lab
+#
+#  PyLaDa is a high throughput computational platform for Physics. It aims to make it easier to submit
+#  large numbers of jobs on supercomputers. It provides a python interface to physical input, such as
+#  crystal structures, as well as to a number of DFT (VASP, CRYSTAL) and atomic potential programs. It
+#  is able to organise and launch computational jobs on PBS and SLURM.
+#
+#  PyLaDa is free software: you can redistribute it and/or modify it under the terms of the GNU General
+#  Public License as published by the Free Software Foundation, either version 3 of the License, or (at
+#  your option) any later version.
+#
+#  PyLaDa is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even
+#  the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with PyLaDa.  If not, see
+#  <http://www.gnu.org/licenses/>.
+###############################
+from pytest import fixture, raises
+
+
+class Output(object):
+    def __init__(self, directory, structure, converged):
+        self.directory = directory
+        self.structure = structure
+        self.converged = converged
+        self.success = True
+
+
+class Functional(object):
+    """ Stands in for VASP: each call follows a script of (moves, converged). """
+
+    def __init__(self, script):
+        self._input = {}
+        self.relaxation = 'cellshape ionic'
+        self.ediff = 1e-5
+        self.script = list(script)
+        self.calls = []
+        self.outputs = {}
+
+    def iter(self, structure, outdir=None, restart=None, relaxation=None, **kwargs):
+        from os.path import basename, dirname
+        moves, converged = self.script.pop(0) if self.script else (False, True)
+        step = basename(dirname(outdir)) + '/' + basename(outdir)
+        self.calls.append((relaxation, step if relaxation != 'static' else None, kwargs))
+        result = structure.copy()
+        if moves:
+            result.cell = result.cell * 1.01
+        self.outputs[outdir] = Output(outdir, result, converged)
+        yield self.outputs[outdir]
+
+    def Extract(self, outdir):
+        return self.outputs[outdir]
+
+
+@fixture
+def structure():
+    from pylada.crystal import Structure
+    return Structure().add_atom(0, 0, 0, 'Si')
+
+
+def converged(extractor):
+    return extractor.converged
+
+
+def run(vasp, structure, tmpdir, **kwargs):
+    from pylada.vasp.relax import iter_training
+    for _ in iter_training(vasp, structure, outdir=str(tmpdir), convergence=converged,
+                           **kwargs):
+        pass
+    return [call[:2] for call in vasp.calls]
+
+
+def test_converged_cellshape_skips_ions(structure, tmpdir):
+    vasp = Functional([(True, True)])
+    assert run(vasp, structure, tmpdir, skip_ions_if_converged=True) \
+        == [('cellshape ionic', 'relax_cellshape/0'), ('static', None)]
+
+
+def test_no_skip_always_runs_ions(structure, tmpdir):
+    vasp = Functional([(True, True)])
+    assert run(vasp, structure, tmpdir) \
+        == [('cellshape ionic', 'relax_cellshape/0'), ('ionic', 'relax_ions/1'),
+            ('static', None)]
+
+
+def test_first_trial_only_applies_to_first_call(structure, tmpdir):
+    vasp = Functional([(True, False), (True, False), (True, True)])
+    run(vasp, structure, tmpdir, first_trial={'encut': 1.5})
+    assert [call[2].get('encut') for call in vasp.calls] == [1.5, None, None, None]
+
+
+def test_maxcalls(structure, tmpdir):
+    from pylada.error import ExternalRunFailed
+    vasp = Functional([(True, False)] * 4)
+    assert run(vasp, structure, tmpdir, maxcalls=4, nofail=True) \
+        == [('cellshape ionic', 'relax_cellshape/0'), ('ionic', 'relax_ions/1'),
+            ('cellshape ionic', 'relax_cellshape/2'), ('ionic', 'relax_ions/3'),
+            ('static', None)]
+
+    vasp = Functional([(True, False)] * 4)
+    with raises(ExternalRunFailed):
+        run(vasp, structure, tmpdir.join('fail'), maxcalls=4)
+
+
+def test_training_defaults_to_ionic_pass():
+    from pylada.vasp.relax import Training
+    functional = Training()
+    assert functional.skip_ions_if_converged is False
+    # as unpickled from before the attribute existed.
+    del functional.skip_ions_if_converged
+    assert functional.skip_ions_if_converged is False